@@ -32,9 +32,11 @@ final class MLXRuntimeBootstrapManager {
     private let queue = DispatchQueue(label: "com.visperflow.parakeet.bootstrap", qos: .userInitiated)
     private let statusLock = NSLock()
     private let fileManager = FileManager.default
-    // Parakeet TDT requires onnx-asr compatibility glue; raw ONNX fallback is
-    // not sufficient for this model family.
     private let runtimeDependencies = ["parakeet-mlx", "mlx-whisper"]
+    // Speed-ups the runner can do without (orjson has a stdlib json
+    // fallback). Installed in a separate best-effort step and kept out of
+    // `dependencyImportProbe`, so a failed install never fails bootstrap.
+    private let optionalRuntimeDependencies = ["orjson"]
     private let commandTimeoutSeconds: TimeInterval = 45 * 60
     private let networkCommandTimeoutSeconds: TimeInterval = 20 * 60
     private let minimumSupportedPythonMinor = 10
@@ -348,7 +350,7 @@ private extension MLXRuntimeBootstrapManager {
 
         updateStatus(
             phase: .bootstrapping,
-            detail: "Installing dependencies (numpy, onnxruntime, onnx-asr)…",
+            detail: "Installing dependencies (parakeet-mlx, mlx-whisper)…",
             runtimeDirectory: runtimeRoot,
             pythonCommand: venvPythonURL.path
         )
@@ -361,6 +363,20 @@ private extension MLXRuntimeBootstrapManager {
             step: "install Parakeet runtime dependencies"
         )
 
+        do {
+            try runCommand(
+                executablePath: venvPythonURL.path,
+                arguments: [
+                    "-m", "pip", "install", "--disable-pip-version-check",
+                    "--no-input", "--progress-bar", "off", "--upgrade"
+                ] + optionalRuntimeDependencies,
+                step: "install optional runtime dependencies"
+            )
+        } catch {
+            // The runner falls back to slower stdlib paths without these.
+            bootstrapLogger.warning("Optional runtime dependencies failed to install; continuing without them: \(error.localizedDescription, privacy: .public)")
+        }
+
         updateStatus(
             phase: .bootstrapping,
             detail: "Verifying Python runtime imports…",
@@ -797,7 +813,7 @@ private extension MLXRuntimeBootstrapManager {
 
         updateStatus(
             phase: .bootstrapping,
-            detail: "Installing dependencies (numpy, onnxruntime, onnx-asr)…",
+            detail: "Installing dependencies (parakeet-mlx, mlx-whisper)…",
             runtimeDirectory: runtimeRoot,
             pythonCommand: pythonCommand
         )
@@ -811,6 +827,21 @@ private extension MLXRuntimeBootstrapManager {
             step: "install managed runtime dependencies"
         )
 
+        do {
+            _ = try runCommand(
+                executablePath: "/usr/bin/env",
+                arguments: [
+                    pythonCommand, "-m", "pip", "install",
+                    "--disable-pip-version-check", "--no-input", "--progress-bar", "off",
+                    "--upgrade", "--target", sitePackagesDirectory.path
+                ] + optionalRuntimeDependencies,
+                step: "install optional managed runtime dependencies"
+            )
+        } catch {
+            // The runner falls back to slower stdlib paths without these.
+            bootstrapLogger.warning("Optional runtime dependencies failed to install; continuing without them: \(error.localizedDescription, privacy: .public)")
+        }
+
         let shimURL = try ensureShimPythonLauncher(
             runtimeRoot: runtimeRoot,
             basePythonCommand: pythonCommand,
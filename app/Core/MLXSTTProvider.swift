@@ -5,8 +5,8 @@ import os.log
 private let logger = Logger(subsystem: "com.visperflow", category: "MLXSTT")
 
 /// Local speech-to-text via MLX (parakeet-mlx / mlx-whisper) running in the
-/// app-managed Python runtime. Buffers PCM during the session, then hands a
-/// WAV file to a long-lived runner daemon on session end.
+/// app-managed Python runtime. Streams PCM to a long-lived runner daemon
+/// while recording, falling back to one batch request on session end.
 ///
 /// The daemon (`mlx_stt_infer.py --serve`) loads the model once and stays
 /// resident, so per-dictation latency is inference-only instead of paying
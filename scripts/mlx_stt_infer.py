@@ -6,11 +6,16 @@ WAV input with the standard library and feeding raw sample arrays to the
 MLX packages.
 
 Modes:
-  --check                                  verify imports work (exit 0/1)
+  --check [--engine E]                     verify imports work (exit 0/1)
   --download --engine E --model REPO       prefetch model into the HF cache
-  --engine E --model REPO --audio F.wav    transcribe; plain text on stdout
   --serve --engine E --model REPO          long-lived daemon: load the model
                                            once, then serve JSONL requests
+  --engine E --model REPO --audio F.wav    transcribe; plain text on stdout
+
+--serve is the transcription path the app uses: MLXSTTProvider keeps one
+daemon resident (prewarmed at provider init) so model load and Metal kernel
+compilation are paid once, not per dictation. The one-shot --audio mode
+loads the model on every invocation and exists only for manual debugging.
 
 Serve protocol (newline-delimited JSON):
   stdout after model load + warmup:  {"event": "ready"}
@@ -43,12 +48,32 @@ import json
 import sys
 import wave
 
+try:
+    import orjson
+except ImportError:  # optional speed-up; stdlib json is the fallback
+    orjson = None
+
 
 def fail(message: str, code: int = 1) -> "NoReturn":  # noqa: F821
     print(message, file=sys.stderr)
     sys.exit(code)
 
 
+def pcm_to_float32(raw, dtype, scale: float):
+    """Convert integer PCM bytes to float32 samples in a single pass.
+
+    Multiplying straight into a preallocated float32 buffer avoids the
+    astype() copy plus a second full traversal for the divide. The scales
+    used here are powers of two, so the result is bit-identical.
+    """
+    import numpy as np
+
+    ints = np.frombuffer(raw, dtype=dtype)
+    samples = np.empty(ints.shape[0], dtype=np.float32)
+    np.multiply(ints, np.float32(scale), out=samples, dtype=np.float32)
+    return samples
+
+
 def read_wav_float32(path: str):
     """Decode a WAV file to (float32 numpy array in [-1, 1], sample_rate)."""
     import numpy as np
@@ -60,9 +85,9 @@ def read_wav_float32(path: str):
         frames = wav.readframes(wav.getnframes())
 
     if width == 2:
-        samples = np.frombuffer(frames, dtype=np.int16).astype(np.float32) / 32768.0
+        samples = pcm_to_float32(frames, "<i2", 1.0 / 32768.0)
     elif width == 4:
-        samples = np.frombuffer(frames, dtype=np.int32).astype(np.float32) / 2147483648.0
+        samples = pcm_to_float32(frames, "<i4", 1.0 / 2147483648.0)
     else:
         fail(f"Unsupported WAV sample width: {width * 8}-bit")
 
@@ -83,27 +108,32 @@ def read_wav_float32(path: str):
     return samples
 
 
-def run_check() -> None:
+def run_check(engine=None) -> None:
+    """Import-only runtime check. With --engine, only that engine's package
+    is imported, so checking one engine doesn't pay the other's import."""
+    import importlib
+
+    modules = {"parakeet": ["parakeet_mlx"], "whisper": ["mlx_whisper"]}
+    names = modules[engine] if engine else modules["parakeet"] + modules["whisper"]
     try:
-        import parakeet_mlx  # noqa: F401
-        import mlx_whisper  # noqa: F401
+        for name in names:
+            importlib.import_module(name)
     except Exception as exc:  # pragma: no cover
         fail(f"MLX runtime import failed: {exc}")
     print("ok")
 
 
+# parakeet-mlx loads exactly these two files.
+PARAKEET_FILES = ["config.json", "model.safetensors"]
+
+
 def run_download(engine: str, model: str) -> None:
     from huggingface_hub import snapshot_download
 
     tqdm_class = _make_progress_tqdm()
     kwargs = {"tqdm_class": tqdm_class} if tqdm_class is not None else {}
     if engine == "parakeet":
-        # parakeet-mlx loads exactly these two files.
-        snapshot_download(
-            repo_id=model,
-            allow_patterns=["config.json", "model.safetensors"],
-            **kwargs,
-        )
+        snapshot_download(repo_id=model, allow_patterns=PARAKEET_FILES, **kwargs)
     else:
         snapshot_download(repo_id=model, **kwargs)
     # Guarantee the bar lands on 100% even if the last update was coalesced.
@@ -152,10 +182,7 @@ def decode_pcm_base64(b64: str):
     """Decode base64 int16 LE mono 16 kHz PCM to float32 in [-1, 1]."""
     import base64
 
-    import numpy as np
-
-    raw = base64.b64decode(b64)
-    return np.frombuffer(raw, dtype="<i2").astype(np.float32) / 32768.0
+    return pcm_to_float32(base64.b64decode(b64), "<i2", 1.0 / 32768.0)
 
 
 class ParakeetStream:
@@ -269,21 +296,71 @@ class AccumulatingStream:
 
 
 class Engine:
-    """Loaded model exposing batch transcription and streaming sessions."""
+    """Loaded model exposing batch transcription and streaming sessions.
+
+    `warmup` runs once before the daemon reports ready; by default it is a
+    short silent batch transcription.
+    """
 
-    def __init__(self, batch, open_stream):
+    def __init__(self, batch, open_stream, warmup=None):
         self.batch = batch
         self.open_stream = open_stream
+        self.warmup = warmup or self._batch_warmup
+
+    def _batch_warmup(self) -> None:
+        import numpy as np
+
+        self.batch(np.zeros(8000, dtype=np.float32))
+
+
+def _has_model_files(engine: str, directory) -> bool:
+    """True when `directory` holds every file the engine's loader reads."""
+    from pathlib import Path
+
+    root = Path(directory)
+    if engine == "parakeet":
+        return all((root / name).is_file() for name in PARAKEET_FILES)
+    # mlx-whisper reads config.json plus weights.safetensors (or legacy .npz).
+    return (root / "config.json").is_file() and (
+        (root / "weights.safetensors").is_file() or (root / "weights.npz").is_file()
+    )
+
+
+def resolve_cached_model(engine: str, model_repo: str) -> str:
+    """Local snapshot directory for an already-downloaded model, else the repo id.
+
+    Given a repo id, both engines go through the Hub client, which revalidates
+    every file against the network on each load (and stalls on timeouts when
+    offline). --download already populated the cache, so loading straight
+    from the snapshot directory skips that round-trip on every daemon start.
+
+    snapshot_download(local_files_only=True) only resolves the cached ref and
+    does not check which files the snapshot holds, so the directory is used
+    only if the engine's config and weights are actually present. A partial
+    or pruned cache falls back to the repo id, letting the Hub client fetch
+    whatever is missing.
+    """
+    try:
+        from huggingface_hub import snapshot_download
+
+        directory = snapshot_download(repo_id=model_repo, local_files_only=True)
+    except Exception:
+        return model_repo
+    return directory if _has_model_files(engine, directory) else model_repo
 
 
 def load_engine(engine: str, model_repo: str) -> Engine:
     """Load the model once; returns batch + streaming entry points."""
+    model_source = resolve_cached_model(engine, model_repo)
+
     if engine == "parakeet":
         import mlx.core as mx
+        import numpy as np
         from parakeet_mlx import from_pretrained
         from parakeet_mlx.audio import get_logmel
 
-        model = from_pretrained(model_repo)
+        # Accepts either a repo id or a local model directory.
+        model = from_pretrained(model_source)
 
         def batch(samples) -> str:
             mel = get_logmel(mx.array(samples), model.preprocessor_config)
@@ -292,7 +369,26 @@ def load_engine(engine: str, model_repo: str) -> Engine:
                 return ""
             return results[0].text.strip()
 
-        return Engine(batch=batch, open_stream=lambda: ParakeetStream(model, batch))
+        def warmup() -> None:
+            # Clips past the crossover decode through transcribe_stream,
+            # whose first add_audio compiles its own kernels; warm both
+            # paths so neither short nor long first dictations pay for it.
+            batch(np.zeros(ParakeetStream.FLUSH_SAMPLES, dtype=np.float32))
+            stream = ParakeetStream(model, batch)
+            try:
+                stream.add(np.zeros(
+                    ParakeetStream.BATCH_STREAM_CROSSOVER_SAMPLES + ParakeetStream.FLUSH_SAMPLES,
+                    dtype=np.float32,
+                ))
+                stream.finish()
+            finally:
+                stream.close()
+
+        return Engine(
+            batch=batch,
+            open_stream=lambda: ParakeetStream(model, batch),
+            warmup=warmup,
+        )
 
     import mlx_whisper
 
@@ -304,7 +400,7 @@ def load_engine(engine: str, model_repo: str) -> Engine:
         # time substantially on short utterances.
         result = mlx_whisper.transcribe(
             samples,
-            path_or_hf_repo=model_repo,
+            path_or_hf_repo=model_source,
             verbose=None,
             temperature=0.0,
             condition_on_previous_text=False,
@@ -327,20 +423,32 @@ def transcribe_whisper(model_repo: str, audio_path: str) -> str:
     return load_transcriber("whisper", model_repo)(read_wav_float32(audio_path))
 
 
+def json_loads(data):
+    """Parse one protocol line (str or UTF-8 bytes)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_line(payload: dict) -> bytes:
+    """Encode one protocol line as UTF-8 bytes, newline included."""
+    if orjson is not None:
+        return orjson.dumps(payload) + b"\n"
+    return (json.dumps(payload) + "\n").encode("utf-8")
+
+
 def emit(payload: dict) -> None:
-    sys.stdout.write(json.dumps(payload) + "\n")
-    sys.stdout.flush()
+    sys.stdout.buffer.write(json_line(payload))
+    sys.stdout.buffer.flush()
 
 
 def run_serve(engine: str, model_repo: str) -> None:
-    import numpy as np
-
     loaded = load_engine(engine, model_repo)
 
     # Warm up: triggers weight loading (whisper) and Metal kernel compilation
     # so the first real request runs at steady-state speed.
     try:
-        loaded.batch(np.zeros(8000, dtype=np.float32))
+        loaded.warmup()
     except Exception as exc:  # pragma: no cover - warmup is best-effort
         print(f"warmup failed: {exc}", file=sys.stderr)
 
@@ -356,13 +464,15 @@ def run_serve(engine: str, model_repo: str) -> None:
         stream = None
         stream_error = None
 
-    for line in sys.stdin:
+    # Raw bytes in: both json parsers take UTF-8 bytes directly, so the
+    # large base64 PCM lines skip a separate text-decoding pass.
+    for line in sys.stdin.buffer:
         line = line.strip()
         if not line:
             continue
         try:
-            request = json.loads(line)
-        except json.JSONDecodeError as exc:
+            request = json_loads(line)
+        except ValueError as exc:  # JSONDecodeError or invalid UTF-8
             emit({"error": f"malformed request: {exc}"})
             continue
 
@@ -439,7 +549,7 @@ def main() -> None:
     args = parser.parse_args()
 
     if args.check:
-        run_check()
+        run_check(args.engine)
         return
 
     if not args.engine or not args.model: